@@ -4,7 +4,7 @@ Cleanup coordination for Thorlabs OCT and stage hardware.
 This module provides a single unified cleanup function that coordinates
 the shutdown of both OCT scanner and stage control hardware.
 """
-import gc
+import importlib
 
 
 def yOCTCloseAllHardware():
@@ -12,7 +12,7 @@ def yOCTCloseAllHardware():
 
     This is the primary cleanup function that should be called at program exit.
     It coordinates cleanup of all resources in the correct order:
-    1. Close all stage axes (disconnect → close each device)
+    1. Close all stage axes in parallel (disconnect → close each device)
     2. Close OCT scanner resources
     
     This function is idempotent - safe to call multiple times.
@@ -26,22 +26,29 @@ def yOCTCloseAllHardware():
     """
     # 1. Close all stage handles first (hardware before software SDK)
     try:
-        from .thorlabs_imager_stage import yOCTCloseAllStages
-        yOCTCloseAllStages()
+        _import_sibling('thorlabs_imager_stage').yOCTCloseAllStages()
     except Exception:
         # Best-effort fallback: ignore if stage module not available
         pass
 
     # 2. Close OCT scanner resources
     try:
-        from .thorlabs_imager_oct import yOCTScannerClose, yOCTScannerIsInitialized
-        if yOCTScannerIsInitialized():
-            yOCTScannerClose()
+        oct_module = _import_sibling('thorlabs_imager_oct')
+        if oct_module.yOCTScannerIsInitialized():
+            oct_module.yOCTScannerClose()
     except Exception:
         pass  
 
-    # 3. Force final garbage collection to ensure all resources released
-    gc.collect()
+
+def _import_sibling(module_name: str):
+    """Import a module from this folder.
+
+    MATLAB puts this folder on sys.path and imports the modules as top-level
+    modules, where a relative import would fail.
+    """
+    if __package__:
+        module_name = f"{__package__}.{module_name}"
+    return importlib.import_module(module_name)
 
 
 __all__ = ['yOCTCloseAllHardware']
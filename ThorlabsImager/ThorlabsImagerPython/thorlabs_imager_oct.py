@@ -16,20 +16,68 @@ Function Naming Convention:
 
 from pyspectralradar import OCTSystem, RawData, OCTFile
 import pyspectralradar.types as pt
+import io
 import os
+import re
 import time
-import gc  
+import threading
+import gc
 import zipfile
 import shutil
+import pathlib
+import math
+from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor
+try:
+    from lxml import etree as ET  # Optional: C parser/serializer for Header.xml
+    _HAS_LXML = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+    _HAS_LXML = False
+
+
+@dataclass
+class _ScannerState:
+    """SDK objects and configuration kept across function calls."""
+    oct_system: object = None
+    device: object = None
+    probe: object = None
+    processing: object = None
+    probe_config: dict = field(default_factory=dict)
+    initialized: bool = False
+
+
+# Module state, mutated in place so functions need no global statements
+_scanner = _ScannerState()
+
+# Guards _scanner while it is opened or closed. Only the scanner takes it, so
+# stage calls never wait on a scanner init/close
+_oct_lock = threading.Lock()
+
+# Chunk size used to stream .oct archive members to disk
+_EXTRACT_CHUNK_BYTES = 1 << 20
 
+# Most threads used to extract an .oct archive; beyond this the disk is the limit
+_EXTRACT_MAX_THREADS = 8
 
-# Global variables to maintain state across function calls
-_oct_system = None
-_device = None
-_probe = None
-_processing = None
-_probe_config = {}
-_scanner_initialized = False
+# How long the USB device may take to become available again after close
+_USB_RELEASE_TIMEOUT_S = 1.0
+
+# Probe .ini keys yOCTScannerInit requires: galvo calibration and the
+# myOCT-specific dynamic calibration
+_REQUIRED_PROBE_KEYS = ('FactorX', 'FactorY', 'OffsetX', 'OffsetY',
+                        'DynamicFactorX', 'DynamicOffsetX')
+
+# One "key = value" line of a probe .ini file. Exactly one of groups 2-6
+# matches, and its index tells _read_probe_ini how to convert the value.
+_PROBE_INI_LINE_RE = re.compile(r"""
+    ^[ \t]*([A-Za-z_]\w*)[ \t]*=[ \t]*                          # 1: key
+    (?:'([^'\n]*)'                                              # 2: 'quoted string'
+      |\[([^\]\n]*)\]                                           # 3: [list, of, numbers]
+      |([-+]?(?:\d+\.\d*|\.\d+|\d+(?=[eE]))(?:[eE][-+]?\d+)?)   # 4: float
+      |([-+]?\d+)                                               # 5: int
+      |(.*?))                                                   # 6: anything else, kept as string
+    [ \t]*$""", re.MULTILINE | re.VERBOSE)
 
 
 def yOCTScannerInit(octProbePath : str) -> None:
@@ -45,49 +93,56 @@ def yOCTScannerInit(octProbePath : str) -> None:
     
     Raises:
         FileNotFoundError: If probe file does not exist
+        ValueError: If probe file cannot be parsed or lacks required keys
         RuntimeError: If OCT system initialization fails
     """
-    global _oct_system, _device, _probe, _processing, _probe_config, _scanner_initialized
-    
     # Check file exists early for clearer error message
     if not os.path.exists(octProbePath):
         raise FileNotFoundError(f"Probe configuration file not found: {octProbePath}")
-    
-    # Initialize OCT system - SDK will connect to hardware
-    try:
-        _oct_system = OCTSystem()
-        _device = _oct_system.dev
-    except Exception as e:
-        # Provide helpful error message for common hardware issues
-        error_msg = str(e)
-        if "No initialization response" in error_msg or "Failed to open data device" in error_msg:
-            raise RuntimeError(
-                f"Failed to connect to OCT device: {error_msg}\n"
-                "Common causes:\n"
-                "  1. OCT base unit is powered OFF - check power LED\n"
-                "  2. USB cable is disconnected or loose\n"
-                "  3. Device still held by previous connection - try restarting MATLAB\n"
-                "  4. USB hub/port issue - try different USB port"
-            ) from e
-        else:
-            # Re-raise other errors as-is
-            raise
-    
-    # Load probe configuration from .ini file
+
+    # Load probe configuration from .ini file before touching the hardware, so
+    # a bad probe file fails without a device open/close cycle.
     # This dictionary contains all parameters, including myOCT-specific ones
     # (like DynamicFactorX, Oct2StageXYAngleDeg) that aren't SDK properties
-    _probe_config = _read_probe_ini(octProbePath)
-    
-    # Create probe with default settings, then configure from .ini file
-    _probe = _oct_system.probe_factory.create_default()
-    
-    # Apply calibration parameters from .ini file to probe
-    _apply_probe_config_to_probe(_probe, _probe_config)
-    
-    # Create processing pipeline
-    _processing = _oct_system.processing_factory.from_device()
-    
-    _scanner_initialized = True
+    probe_config = _read_probe_ini(octProbePath)
+    missing_keys = [key for key in _REQUIRED_PROBE_KEYS if key not in probe_config]
+    if missing_keys:
+        raise ValueError(f"Probe configuration file {octProbePath} is missing "
+                         f"required keys: {', '.join(missing_keys)}")
+
+    with _oct_lock:
+        # Initialize OCT system - SDK will connect to hardware
+        try:
+            _scanner.oct_system = _open_oct_system()
+            _scanner.device = _scanner.oct_system.dev
+        except Exception as e:
+            # Provide helpful error message for common hardware issues
+            error_msg = str(e)
+            if _is_device_unavailable_error(e):
+                raise RuntimeError(
+                    f"Failed to connect to OCT device: {error_msg}\n"
+                    "Common causes:\n"
+                    "  1. OCT base unit is powered OFF - check power LED\n"
+                    "  2. USB cable is disconnected or loose\n"
+                    "  3. Device still held by previous connection - try restarting MATLAB\n"
+                    "  4. USB hub/port issue - try different USB port"
+                ) from e
+            else:
+                # Re-raise other errors as-is
+                raise
+
+        _scanner.probe_config = probe_config
+
+        # Create probe with default settings, then configure from .ini file
+        _scanner.probe = _scanner.oct_system.probe_factory.create_default()
+
+        # Apply calibration parameters from .ini file to probe
+        _apply_probe_config_to_probe(_scanner.probe, _scanner.probe_config)
+
+        # Create processing pipeline
+        _scanner.processing = _scanner.oct_system.processing_factory.from_device()
+
+        _scanner.initialized = True
 
 
 def yOCTScannerIsInitialized():
@@ -96,7 +151,7 @@ def yOCTScannerIsInitialized():
     Returns:
         bool: True if scanner is initialized, False otherwise
     """
-    return _scanner_initialized
+    return _scanner.initialized
 
 
 def yOCTScannerClose():
@@ -104,8 +159,8 @@ def yOCTScannerClose():
     
     Equivalent to C++/DLL: ThorlabsImagerNET.ThorlabsImager.yOCTScannerClose()
     
-    Explicitly deletes scanner objects and forces garbage collection to ensure
-    immediate resource cleanup and USB device release.
+    Drops the references to the scanner objects and forces garbage collection
+    to ensure immediate resource cleanup and USB device release.
     
     Args:
         None
@@ -116,52 +171,32 @@ def yOCTScannerClose():
     Raises:
         None
     """
-    global _oct_system, _device, _probe, _processing, _scanner_initialized
+    with _oct_lock:
+        # Nothing open: skip the garbage collection below
+        if not _scanner.initialized and _scanner.oct_system is None:
+            return
+
+        # Stop any ongoing acquisition before closing
+        if _scanner.device is not None:
+            try:
+                # Ensure acquisition is fully stopped
+                _scanner.device.acquisition.stop()
+            except:
+                pass  # May already be stopped
+
+        # Set all to None to clear references, in reverse order of creation
+        _scanner.processing = None
+        _scanner.probe = None
+        _scanner.device = None
+        _scanner.oct_system = None
+        _scanner.initialized = False
 
-    # Stop any ongoing acquisition before closing
-    if _device is not None:
-        try:
-            # Ensure acquisition is fully stopped
-            _device.acquisition.stop()
-        except:
-            pass  # May already be stopped
-    
-    # Explicitly delete objects in reverse order to force destructors
-    # This ensures SDK releases USB device immediately
-    if _processing is not None:
-        try:
-            del _processing
-        except:
-            pass
-    if _probe is not None:
-        try:
-            del _probe
-        except:
-            pass
-    if _device is not None:
-        try:
-            del _device
-        except:
-            pass
-    if _oct_system is not None:
-        try:
-            del _oct_system
-        except:
-            pass
-    
-    # Now set all to None to clear references
-    _processing = None
-    _probe = None
-    _device = None
-    _oct_system = None
-    _scanner_initialized = False
-    
     # Force garbage collection NOW - critical in MATLAB environment
     # Without this, Python might keep objects alive indefinitely
     gc.collect()
-    
-    # Give hardware extra time to fully release USB connection
-    time.sleep(1.0)
+
+    # No wait for the USB connection to be released here; the next
+    # yOCTScannerInit retries the open for as long as that takes
 
 
 def yOCTScan3DVolume(centerX_mm: float, centerY_mm: float, 
@@ -193,10 +228,9 @@ def yOCTScan3DVolume(centerX_mm: float, centerY_mm: float,
     Raises:
         RuntimeError: If scanner is not initialized
         FileExistsError: If outputFolder already exists
+        OSError: If the output drive does not have room for the scan
     """
-    global _scanner_initialized, _device, _probe, _processing
-    
-    if not _scanner_initialized:
+    if not _scanner.initialized:
         raise RuntimeError("Scanner not initialized. Call yOCTScannerInit() first.")
     
     # Check if output folder already exists
@@ -211,14 +245,15 @@ def yOCTScan3DVolume(centerX_mm: float, centerY_mm: float,
     oct_file = None
     frames = None
     acquisition_started = False
+    required_bytes = None
     
     try:
         # Set B-scan averaging on probe and processing
-        _probe.properties.set_oversampling_slow_axis(nBScanAvg)
-        _processing.properties.set_bscan_avg(nBScanAvg)
+        _scanner.probe.properties.set_oversampling_slow_axis(nBScanAvg)
+        _scanner.processing.properties.set_bscan_avg(nBScanAvg)
         
         # Create volume scan pattern
-        scan_pattern = _probe.scan_pattern.create_volume_pattern(
+        scan_pattern = _scanner.probe.scan_pattern.create_volume_pattern(
             rangeX_mm,  # range X in mm
             nXPixels,   # A-scans per B-scan
             rangeY_mm,  # range Y in mm
@@ -231,16 +266,16 @@ def yOCTScan3DVolume(centerX_mm: float, centerY_mm: float,
         scan_pattern.shift(centerX_mm, centerY_mm)
         
         # Apply rotation if specified
-        if rotationAngle_deg != 0:
-            scan_pattern.rotate(rotationAngle_deg * 3.14159265359 / 180.0)  # Convert to radians
+        if rotationAngle_deg:
+            scan_pattern.rotate(math.radians(rotationAngle_deg))
         
         # Ask the SDK whether the acquisition fits in memory, so
         # an oversized request fails here with a clear message instead of a
         # cryptic Matrox error mid-acquisition:
         try:
             required_bytes = scan_pattern.memory_requirements(
-                _device, pt.AcqType.ASYNC_FINITE)
-            if not scan_pattern.check_available_memory_for_raw_data(_device, 0):
+                _scanner.device, pt.AcqType.ASYNC_FINITE)
+            if not scan_pattern.check_available_memory_for_raw_data(_scanner.device, 0):
                 raise MemoryError(
                     f"SDK reports insufficient memory for this scan pattern "
                     f"({required_bytes / 2**30:.1f} GiB required; "
@@ -250,6 +285,16 @@ def yOCTScan3DVolume(centerX_mm: float, centerY_mm: float,
         except Exception:
             pass
 
+        # The .oct archive and its extracted files are both on disk until the
+        # archive is deleted, so fail before acquiring, not when a write fails
+        if required_bytes:
+            free_bytes = shutil.disk_usage(outputFolder).free
+            if free_bytes < 2 * required_bytes:
+                raise OSError(
+                    f"Not enough free disk space for this scan in {outputFolder} "
+                    f"({2 * required_bytes / 2**30:.1f} GiB needed, "
+                    f"{free_bytes / 2**30:.1f} GiB free).")
+
         # With slow-axis oversampling the acquisition delivers
         # nYPixels * nBScanAvg B-scans (the repeats of each Y position arrive consecutively)
         total_bscans = int(nYPixels) * int(max(1, nBScanAvg))
@@ -261,13 +306,13 @@ def yOCTScan3DVolume(centerX_mm: float, centerY_mm: float,
 
         # Start acquisition
         time_start = time.time()
-        _device.acquisition.start(scan_pattern, pt.AcqType.ASYNC_FINITE)
+        _scanner.device.acquisition.start(scan_pattern, pt.AcqType.ASYNC_FINITE)
         acquisition_started = True
 
         # Drain the acquisition one B-scan at a time. Files are written in
         # arrival order, Spectral{(y-1)*nBScanAvg + (avg-1)}.data:
         for bscan_idx in range(total_bscans):
-            _device.acquisition.get_raw_data(buffer=raw_data)
+            _scanner.device.acquisition.get_raw_data(buffer=raw_data)
             if raw_data.lost_frames:
                 # A lost frame would leave a hole in this tile, and reading on
                 # would eventually block forever waiting for frames that never arrive:
@@ -280,15 +325,15 @@ def yOCTScan3DVolume(centerX_mm: float, centerY_mm: float,
             frames.append(frame_copy)
 
         # Stop acquisition
-        _device.acquisition.stop()
+        _scanner.device.acquisition.stop()
         acquisition_started = False
         time_end = time.time()
 
         # Save calibration files: Chirp and Offset
-        oct_file.save_calibration(_processing, 0)
+        oct_file.save_calibration(_scanner.processing, 0)
 
         # Set metadata from the scan
-        oct_file.set_metadata(_device, _processing, _probe, scan_pattern)
+        oct_file.set_metadata(_scanner.device, _scanner.processing, _scanner.probe, scan_pattern)
 
         # Set acquisition time
         acq_time = time_end - time_start
@@ -303,13 +348,13 @@ def yOCTScan3DVolume(centerX_mm: float, centerY_mm: float,
 
         # Extract .oct file for MATLAB compatibility
         # The .oct file is a ZIP archive, we need to extract it so MATLAB can read it
-        with zipfile.ZipFile(oct_file_path, 'r') as zip_ref:
-            zip_ref.extractall(outputFolder)
+        extracted_sizes = _extract_oct_file(oct_file_path, outputFolder)
 
         # Delete the .oct file after extraction to avoid duplication
         # MATLAB expects to find extracted files, not the .oct archive
         os.remove(oct_file_path)
-        _fix_header_xml_for_matlab(outputFolder, raw_data, _probe, nYPixels, nBScanAvg)
+        _fix_header_xml_for_matlab(outputFolder, raw_data, _scanner.probe, nYPixels, nBScanAvg,
+                                   extracted_sizes)
 
         # Drop our references to the SDK objects; the finally block below
         # forces the actual native free.
@@ -322,7 +367,7 @@ def yOCTScan3DVolume(centerX_mm: float, centerY_mm: float,
         # Ensure acquisition is stopped if it was started
         if acquisition_started:
             try:
-                _device.acquisition.stop()
+                _scanner.device.acquisition.stop()
             except Exception:
                 pass  # Best effort
 
@@ -351,6 +396,106 @@ def yOCTScan3DVolume(centerX_mm: float, centerY_mm: float,
 # ============================================================================
 
 
+def _open_oct_system() -> OCTSystem:
+    """Open the OCT system, retrying while the USB device is still busy.
+
+    A device released by yOCTScannerClose can take up to
+    _USB_RELEASE_TIMEOUT_S to become available again. Retry with
+    exponential backoff (10 ms, 20 ms, 40 ms, ...) until it opens, rather
+    than always waiting the full time.
+    """
+    deadline = time.monotonic() + _USB_RELEASE_TIMEOUT_S
+    delay_s = 0.01
+    while True:
+        try:
+            return OCTSystem()
+        except Exception as e:
+            remaining_s = deadline - time.monotonic()
+            if not _is_device_unavailable_error(e) or remaining_s <= 0:
+                raise
+        time.sleep(min(delay_s, remaining_s))
+        delay_s *= 2
+
+
+def _is_device_unavailable_error(error: Exception) -> bool:
+    """True if the SDK failed because it could not reach the OCT device."""
+    error_msg = str(error)
+    return ("No initialization response" in error_msg
+            or "Failed to open data device" in error_msg)
+
+
+def _extract_oct_file(oct_file_path: str, outputFolder: str) -> dict:
+    """Extract every member of an .oct (ZIP) archive into outputFolder.
+
+    Members are streamed to disk in 1 MiB chunks. Member names may use '\\' as
+    the separator (the SDK names data files 'data\\Spectral{i}.data'); both
+    separators are accepted. Absolute paths (a leading '/' or '\\', or a drive
+    letter) and '..' components are rejected with ValueError.
+
+    A volume has one Spectral file per B-scan, so members are split into
+    batches by size and each batch is extracted by its own thread, with its
+    own ZipFile handle.
+
+    Returns:
+        dict: Size in bytes of each extracted file, keyed by its path relative
+        to outputFolder with '/' separators (e.g. 'data/Spectral0.data')
+    """
+    with zipfile.ZipFile(oct_file_path, 'r') as zip_ref:
+        members = []
+        extracted_sizes = {}
+        for member in zip_ref.infolist():
+            name = member.filename.replace('\\', '/')
+            parts = [part for part in name.split('/') if part not in ('', '.')]
+            if not parts or member.is_dir():
+                continue
+            if name.startswith('/') or '..' in parts or ':' in parts[0]:
+                raise ValueError(f"Unsafe path in .oct archive: {member.filename}")
+            members.append((member, os.path.join(outputFolder, *parts)))
+            extracted_sizes['/'.join(parts)] = member.file_size
+
+    for folder in {os.path.dirname(target_path) for _, target_path in members}:
+        os.makedirs(folder, exist_ok=True)
+
+    # Deal members out largest first, so batches end up about the same size
+    n_batches = max(1, min(len(members), os.cpu_count() or 1, _EXTRACT_MAX_THREADS))
+    members.sort(key=lambda item: item[0].file_size, reverse=True)
+    batches = [members[k::n_batches] for k in range(n_batches)]
+    if n_batches == 1:
+        _extract_oct_members(oct_file_path, batches[0])
+        return extracted_sizes
+    with ThreadPoolExecutor(max_workers=n_batches) as executor:
+        for future in [executor.submit(_extract_oct_members, oct_file_path, batch)
+                       for batch in batches]:
+            future.result()  # Raise the first failure, if any
+    return extracted_sizes
+
+
+def _extract_oct_members(oct_file_path: str, members: list) -> None:
+    """Extract (ZipInfo, target_path) pairs using a ZipFile handle of our own."""
+    with zipfile.ZipFile(oct_file_path, 'r') as zip_ref:
+        for member, target_path in members:
+            with zip_ref.open(member) as source, open(target_path, 'wb') as target:
+                shutil.copyfileobj(source, target, _EXTRACT_CHUNK_BYTES)
+
+
+# Numeric probe .ini keys with a fixed type. A listed key gets that type even
+# when written like another (e.g. 'CameraOffsetX = 0' is read as 0.0); other
+# numbers are typed by how they are written.
+_PROBE_KEY_TYPES = {
+    key: float for key in (
+        # Passed to the SDK (see _PROBE_PROPERTY_MAPPINGS)
+        'FactorX', 'FactorY', 'OffsetX', 'OffsetY',
+        'RangeMaxX', 'RangeMaxY',
+        'ApoVoltage', 'FlybackTime',
+        'CameraScalingX', 'CameraScalingY', 'CameraOffsetX', 'CameraOffsetY',
+        'CameraAngle',
+        # Used by myOCT only
+        'ObjectiveWorkingDistance', 'DynamicFactorX', 'DynamicOffsetX',
+        'Oct2StageXYAngleDeg', 'DefaultDispersionQuadraticTerm',
+    )
+}
+
+
 def _read_probe_ini(ini_path: str) -> dict:
     """Read probe configuration from .ini file.
     
@@ -367,51 +512,63 @@ def _read_probe_ini(ini_path: str) -> dict:
     if not os.path.exists(ini_path):
         raise FileNotFoundError(f"Probe configuration file not found: {ini_path}")
     
-    config = {}
-    
+    value_converters = {
+        2: str,
+        3: _parse_float_list,
+        4: float,
+        5: int,
+        6: str,
+    }
+
     try:
-        with open(ini_path, 'r') as f:
-            for line in f:
-                line = line.strip()
-                
-                # Skip comments and empty lines
-                if not line or line.startswith('#') or line.startswith('##'):
-                    continue
-                
-                # Parse key = value pairs
-                if '=' in line:
-                    key, value = line.split('=', 1)
-                    key = key.strip()
-                    value = value.strip()
-                    
-                    # Remove quotes if present
-                    if value.startswith("'") and value.endswith("'"):
-                        value = value[1:-1]
-                    
-                    # Try to convert to appropriate type
-                    try:
-                        # Try float first
-                        if '.' in value or 'e' in value.lower() or 'E' in value:
-                            config[key] = float(value)
-                        else:
-                            # Try int
-                            config[key] = int(value)
-                    except ValueError:
-                        # Handle lists (e.g., OpticalPathCorrectionPolynomial)
-                        if '[' in value and ']' in value:
-                            # Parse list of numbers
-                            list_str = value.strip('[]')
-                            config[key] = [float(x.strip()) for x in list_str.split(',')]
-                        else:
-                            # Keep as string
-                            config[key] = value
-        
+        # Single regex pass over the whole file; comment lines and lines
+        # without '=' simply don't match
+        config = {}
+        text = pathlib.Path(ini_path).read_text(encoding='utf-8', errors='replace')
+        for match in _PROBE_INI_LINE_RE.finditer(text):
+            key, kind = match.group(1), match.lastindex
+            converter = value_converters[kind]
+            if kind in (4, 5):  # Number: a known key's type wins
+                converter = _PROBE_KEY_TYPES.get(key, converter)
+            config[key] = converter(match.group(kind))
         return config
         
     except Exception as e:
         raise ValueError(f"Error parsing probe configuration file: {e}")
 
 
+def _parse_float_list(list_str: str) -> list:
+    """Parse the inside of an .ini list, e.g. '1.0, -2e-3', to a list of floats."""
+    return [float(x.strip()) for x in list_str.split(',')]
+
+
+# .ini file keys and the probe.properties setter each one is passed to (as a
+# float), used by _apply_probe_config_to_probe.
+# Format: ('IniKey', 'setter_method_name')
+_PROBE_PROPERTY_MAPPINGS = (
+    # Galvo calibration
+    ('FactorX', 'set_factor_x'),
+    ('FactorY', 'set_factor_y'),
+    ('OffsetX', 'set_offset_x'),
+    ('OffsetY', 'set_offset_y'),
+    
+    # Field of view
+    ('RangeMaxX', 'set_range_max_x'),
+    ('RangeMaxY', 'set_range_max_y'),
+    
+    # Apodization
+    ('ApoVoltage', 'set_apo_volt_x'),  # Sets both X and Y to same value
+    ('FlybackTime', 'set_flyback_time_sec'),
+    
+    # Camera calibration
+    ('CameraScalingX', 'set_camera_scaling_x'),
+    ('CameraScalingY', 'set_camera_scaling_y'),
+    ('CameraOffsetX', 'set_camera_offset_x'),
+    ('CameraOffsetY', 'set_camera_offset_y'),
+    ('CameraAngle', 'set_camera_angle'),
+)
+
+
 def _apply_probe_config_to_probe(probe, config: dict) -> None:
     """Apply probe configuration parameters to probe object.
     
@@ -425,56 +582,62 @@ def _apply_probe_config_to_probe(probe, config: dict) -> None:
     Returns:
         None
     """
-    # Mapping of .ini file keys to probe.properties setter methods
-    # Format: 'IniKey': ('setter_method_name', conversion_function)
-    property_mappings = {
-        # Galvo calibration
-        'FactorX': ('set_factor_x', float),
-        'FactorY': ('set_factor_y', float),
-        'OffsetX': ('set_offset_x', float),
-        'OffsetY': ('set_offset_y', float),
-        
-        # Field of view
-        'RangeMaxX': ('set_range_max_x', float),
-        'RangeMaxY': ('set_range_max_y', float),
-        
-        # Apodization
-        'ApoVoltage': ('set_apo_volt_x', float),  # Sets both X and Y to same value
-        'FlybackTime': ('set_flyback_time_sec', float),
-        
-        # Camera calibration
-        'CameraScalingX': ('set_camera_scaling_x', float),
-        'CameraScalingY': ('set_camera_scaling_y', float),
-        'CameraOffsetX': ('set_camera_offset_x', float),
-        'CameraOffsetY': ('set_camera_offset_y', float),
-        'CameraAngle': ('set_camera_angle', float),
-    }
-    
-    # Apply each property if it exists in config
-    for ini_key, (setter_name, converter) in property_mappings.items():
-        if ini_key in config:
-            try:
-                # Get the setter method
-                setter = getattr(probe.properties, setter_name)
-                # Convert and set the value
-                value = converter(config[ini_key])
-                setter(value)
-            except AttributeError:
-                pass  # Setter not available in this SDK version
-            except Exception:
-                pass  # Could not set this property
+    props = probe.properties
+
+    # Apply each property if it exists in config. Setters missing from this
+    # SDK version resolve to None instead of raising AttributeError.
+    for ini_key, setter_name in _PROBE_PROPERTY_MAPPINGS:
+        value = config.get(ini_key)
+        if value is None:
+            continue
+        setter = getattr(props, setter_name, None)
+        if setter is None:
+            continue  # Setter not available in this SDK version
+        try:
+            # Convert and set the value
+            setter(float(value))
+        except Exception:
+            pass  # Could not set this property
     
     # Special case: ApoVoltage sets both X and Y
     if 'ApoVoltage' in config:
+        setter_y = getattr(props, 'set_apo_volt_y', None)
+        if setter_y is not None:
+            try:
+                setter_y(float(config['ApoVoltage']))
+            except Exception:
+                pass  # Could not set ApoVoltageY
+
+
+def _write_file_atomic(path: str, data: bytes) -> None:
+    """Write data to a temporary file next to path, then rename it over path."""
+    tmp_path = path + '.tmp'
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
         try:
-            value = float(config['ApoVoltage'])
-            probe.properties.set_apo_volt_y(value)
-        except Exception:
-            pass  # Could not set ApoVoltageY
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _header_xml_parser():
+    """Parser for the SDK's Header.xml: no DTD loading, entity expansion or network.
+
+    Returns None (the default parser) for ElementTree, which never loads
+    external DTDs or entities.
+    """
+    if _HAS_LXML:
+        return ET.XMLParser(no_network=True, load_dtd=False, resolve_entities=False)
+    return None
 
 
 def _fix_header_xml_for_matlab(outputFolder: str, raw_data: RawData, probe,
-                               nYPixels: int = None, nBScanAvg: int = 1) -> None:
+                               nYPixels: int = None, nBScanAvg: int = 1,
+                               extracted_sizes: dict = None) -> None:
     """
     Write Header.xml into the form MATLAB's reader expects.
 
@@ -493,11 +656,11 @@ def _fix_header_xml_for_matlab(outputFolder: str, raw_data: RawData, probe,
             raw_data (RawData): Raw data object from the scan
             nYPixels (int): Number of distinct Y positions (B-scans in the volume)
             nBScanAvg (int): Number of averaged B-scans per Y position
+            extracted_sizes (dict): File sizes returned by _extract_oct_file;
+                if None, data/ is listed instead
         Returns:
             None
     """
-    import xml.etree.ElementTree as ET
-
     header_path = os.path.join(outputFolder, 'Header.xml')
     if not os.path.exists(header_path):
         return
@@ -505,9 +668,21 @@ def _fix_header_xml_for_matlab(outputFolder: str, raw_data: RawData, probe,
     navg = max(1, int(nBScanAvg))
 
     try:
-        tree = ET.parse(header_path)
+        tree = ET.parse(header_path, parser=_header_xml_parser())
         root = tree.getroot()
 
+        # One walk over the tree collects every element edited below
+        raw_datafile_elems, image_elems, acquisition_elems = [], [], []
+        for elem in root.iter():
+            tag = elem.tag
+            if tag == 'DataFile':
+                if elem.get('Type') == 'Raw':
+                    raw_datafile_elems.append(elem)
+            elif tag == 'Image':
+                image_elems.append(elem)
+            elif tag == 'Acquisition':
+                acquisition_elems.append(elem)
+
         # Get dimensions from raw_data
         data_shape = raw_data.shape
         size_z = data_shape[0]  # Spectral points
@@ -516,31 +691,39 @@ def _fix_header_xml_for_matlab(outputFolder: str, raw_data: RawData, probe,
         # Get apodization size
         apo_size = 25  # Default
         try:
-            actual_apo_elem = root.find('.//Acquisition/ActualSizeOfApodization')
-            if actual_apo_elem is not None and actual_apo_elem.text:
-                apo_size = int(actual_apo_elem.text)
+            for acquisition_elem in acquisition_elems:
+                actual_apo_elem = acquisition_elem.find('ActualSizeOfApodization')
+                if actual_apo_elem is not None:
+                    if actual_apo_elem.text:
+                        apo_size = int(actual_apo_elem.text)
+                    break
         except:
             pass
 
+        # Count the split B-scan files and get the size of Spectral0.data.
+        # Total files = (Y positions) * (averages), so the number of distinct Y
+        # positions is that divided by the averaging count.
+        if extracted_sizes is None:
+            extracted_sizes = {}
+            data_folder = os.path.join(outputFolder, 'data')
+            if os.path.isdir(data_folder):
+                with os.scandir(data_folder) as entries:
+                    for entry in entries:
+                        extracted_sizes['data/' + entry.name] = entry.stat().st_size
+        actual_bscans = 0
+        for path in extracted_sizes:
+            if path.startswith('data/Spectral') and path.endswith('.data') and path.count('/') == 1:
+                actual_bscans += 1
+        spectral_0_size = extracted_sizes.get('data/Spectral0.data')
+
         # Single-B-scan width from one file. Each Spectral{i}.data holds
         # exactly one B-scan, so this is the true width.
-        spectral_0_path = os.path.join(outputFolder, 'data', 'Spectral0.data')
-        if os.path.exists(spectral_0_path):
-            file_size_bytes = os.path.getsize(spectral_0_path)
-            elements_per_file = file_size_bytes // 2  # 2 bytes per uint16
+        if spectral_0_size is not None:
+            elements_per_file = spectral_0_size // 2  # 2 bytes per uint16
             interf_size = elements_per_file // size_z
         else:
             interf_size = total_x
 
-        # Count the split B-scan files. Total = (Y positions) * (averages), so the
-        # number of distinct Y positions is that divided by the averaging count.
-        data_folder = os.path.join(outputFolder, 'data')
-        actual_bscans = 0
-        if os.path.exists(data_folder):
-            spectral_files = [f for f in os.listdir(data_folder)
-                            if f.startswith('Spectral') and f.endswith('.data')]
-            actual_bscans = len(spectral_files)
-
         if actual_bscans > 0:
             final_size_y = actual_bscans // navg
         elif nYPixels is not None:
@@ -551,7 +734,7 @@ def _fix_header_xml_for_matlab(outputFolder: str, raw_data: RawData, probe,
         actual_interf_size = interf_size - apo_size
 
         # Update XML metadata
-        for datafile_elem in root.findall('.//DataFile[@Type="Raw"]'):
+        for datafile_elem in raw_datafile_elems:
             datafile_elem.set('SizeZ', str(size_z))
             datafile_elem.set('SizeX', str(interf_size))
             datafile_elem.set('SizeY', str(final_size_y))
@@ -560,30 +743,31 @@ def _fix_header_xml_for_matlab(outputFolder: str, raw_data: RawData, probe,
             datafile_elem.set('ScanRegionStart0', str(apo_size))
             datafile_elem.set('ScanRegionEnd0', str(interf_size))
 
-        for sizex_elem in root.findall('.//Image/SizePixel/SizeX'):
-            sizex_elem.text = str(actual_interf_size)
-
-        for sizey_elem in root.findall('.//Image/SizePixel/SizeY'):
-            sizey_elem.text = str(final_size_y)
-
-        for image_elem in root.findall('.//Image'):
+        for image_elem in image_elems:
+            for sizex_elem in image_elem.findall('SizePixel/SizeX'):
+                sizex_elem.text = str(actual_interf_size)
+            for sizey_elem in image_elem.findall('SizePixel/SizeY'):
+                sizey_elem.text = str(final_size_y)
             if image_elem.get('Type') == 'Processed':
                 image_elem.set('Type', 'RawSpectra')
 
         # Set the averaging count MATLAB reads
         # (Acquisition/SpeckleAveraging/SlowAxis), creating the nodes if missing.
-        if navg > 1:
-            acquisition_elem = root.find('.//Acquisition')
-            if acquisition_elem is not None:
-                speckle_elem = acquisition_elem.find('SpeckleAveraging')
-                if speckle_elem is None:
-                    speckle_elem = ET.SubElement(acquisition_elem, 'SpeckleAveraging')
-                slowaxis_elem = speckle_elem.find('SlowAxis')
-                if slowaxis_elem is None:
-                    slowaxis_elem = ET.SubElement(speckle_elem, 'SlowAxis')
-                slowaxis_elem.text = str(navg)
-
-        tree.write(header_path, encoding='utf-8', xml_declaration=True)
+        if navg > 1 and acquisition_elems:
+            acquisition_elem = acquisition_elems[0]
+            speckle_elem = acquisition_elem.find('SpeckleAveraging')
+            if speckle_elem is None:
+                speckle_elem = ET.SubElement(acquisition_elem, 'SpeckleAveraging')
+            slowaxis_elem = speckle_elem.find('SlowAxis')
+            if slowaxis_elem is None:
+                slowaxis_elem = ET.SubElement(speckle_elem, 'SlowAxis')
+            slowaxis_elem.text = str(navg)
+
+        # Serialize in memory, then replace Header.xml in one write, so a
+        # failure never leaves MATLAB a half-written header
+        buffer = io.BytesIO()
+        tree.write(buffer, encoding='utf-8', xml_declaration=True)
+        _write_file_atomic(header_path, buffer.getvalue())
 
     except:
         pass  # If fixing fails, continue anyway
\ No newline at end of file
@@ -1,10 +1,22 @@
 """
 ThorlabsImager Python module for controlling Thorlabs motorized stages via XA SDK.
-This module provides: yOCTStageInit_1axis, yOCTStageSetPosition_1axis,
-yOCTStageClose_1axis, and yOCTCloseAllStages. 
+This module provides:
+- Init: yOCTStageInit_1axis, yOCTStageInitAll
+- Move: yOCTStageSetPosition_1axis, yOCTStageSetPosition_1axis_async,
+  yOCTStageSetPositions (async), yOCTStageSetPositions_sync,
+  yOCTStageSetPositionXY, yOCTStageWaitMoveComplete
+- Read: yOCTStageGetPosition_1axis
+- Close: yOCTStageClose_1axis, yOCTCloseAllStages
+
+Each initialized axis owns one long-lived worker thread that executes its stage
+commands in submission order, so moves on different axes can run concurrently.
 """
 import os
-import gc
+import ctypes
+import queue
+import asyncio
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 
 from xa_sdk.native_sdks.xa_sdk import XASDK
 from xa_sdk.shared.tlmc_type_structures import (
@@ -18,6 +30,12 @@ from xa_sdk.shared.tlmc_type_structures import (
 from xa_sdk.shared.xa_error_factory import XADeviceException
 from xa_sdk.products.kst201 import KST201
 
+# Enum members used on every move/position read, bound once at import
+_WAIT_INF = TLMC_Wait.TLMC_InfiniteWait
+_SCALE_DIST = TLMC_ScaleType.TLMC_ScaleType_Distance
+_UNIT_MM = TLMC_Unit.TLMC_Unit_Millimetres
+_MODE_ABS = TLMC_MoveModes.MoveMode_Absolute
+
 # Axis to serial number mapping
 _stage_serial_numbers = {
     'x': '26006464',
@@ -25,12 +43,117 @@ _stage_serial_numbers = {
     'z': '26006482'
 }
 
-# Stage handles for each axis
-_stage_handles = {}
+# Per-axis state is kept in fixed-size lists indexed by _AXIS_IDX[axis]
+_AXES = 'xyz'
+_AXIS_IDX = {axis: i for i, axis in enumerate(_AXES)}
+
+# Stage handles for each axis, None if the axis is not initialized
+_stage_handles = [None, None, None]
+
+# Command worker for each axis
+_stage_workers = [None, None, None]
+
+# Linear counts -> mm calibration for each axis: (mm_per_count, offset_mm),
+# or None if the SDK conversion is not linear and must be called every time
+_stage_distance_scale = [None, None, None]
+
+# The same scale, set only if it also reproduces the SDK's mm -> counts
+# conversion, so moves can compute their target counts without an SDK call
+_stage_move_scale = [None, None, None]
+
+# Future of the most recently queued move of each axis
+_stage_last_move = [None, None, None]
+
+# Last known position of each axis in mm, kept current by the axis' worker.
+# None if the position is unknown (e.g. after a failed move).
+_stage_position_mm = [None, None, None]
+
+# Guards the per-axis lists above and the XA SDK startup below. Per-axis state
+# is held only while it is read or swapped, never while a device is opened or
+# closed. _start_xa_sdk also holds it across the one-time SDK load and startup
+# (DLL preload, try_load_library, the chdir fallback and XASDK.startup).
+# Callers read an axis' device and worker together with _initialized_axis; the
+# worker itself reads the scales and writes the position of its axis without it.
+_stage_lock = threading.Lock()
+
+# Serializes opening and configuring devices (KST201 through the velocity
+# params). Concurrent opens are not known to be supported by the XA SDK, so
+# yOCTStageInitAll overlaps only the per-device reads that follow.
+_stage_open_lock = threading.Lock()
+
+# XA SDK load + startup runs once per process. The flag is mirrored on XASDK so
+# it survives MATLAB reloading this module.
+_xa_started = getattr(XASDK, '_oct_xa_started', False)
+
+# Native library behind the XA SDK, shipped next to this file. The handle is
+# kept so the DLL stays loaded for the life of the process
+_XA_NATIVE_DLL = 'tlmc_xa_native.dll'
+_xa_native_dll = None
+
+# Longest a single move may take before the SDK gives up
+_MOVE_TIMEOUT_MS = 120_000
+
+# Moves shorter than this are skipped, the actuator cannot resolve them anyway
+# (ZST225 finish error is ~6e-5 mm)
+_FINISH_ERROR_MM = 1e-4
+
+# Device counts used as the second calibration point
+_CALIBRATION_COUNTS = 1000000
+
+
+class _StageWorker:
+    """Persistent worker thread that runs one axis' stage commands in order."""
+
+    def __init__(self, axis: str):
+        self._axis = axis
+        self._queue = queue.Queue()
+        # Guards _stopped, so nothing is queued behind the stop sentinel
+        self._lock = threading.Lock()
+        self._stopped = False
+        self._thread = threading.Thread(
+            target=self._run, name=f"yOCTStageWorker-{axis}", daemon=True)
+        self._thread.start()
+
+    def submit(self, func, *args) -> Future:
+        """Queue func(*args) and return a Future for its result.
+
+        Raises:
+            RuntimeError: If the worker was stopped (the axis was closed)
+        """
+        future = Future()
+        with self._lock:
+            if self._stopped:
+                raise RuntimeError(f"Stage for axis {self._axis} not initialized.")
+            self._queue.put((future, func, args))
+        return future
+
+    def stop(self) -> None:
+        """Finish queued commands, then stop the thread."""
+        with self._lock:
+            if not self._stopped:
+                self._stopped = True
+                self._queue.put(None)
+        self._thread.join()
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            future, func, args = item
+            if not future.set_running_or_notify_cancel():
+                continue  # Cancelled before it started
+            try:
+                future.set_result(func(*args))
+            except BaseException as e:
+                future.set_exception(e)
 
 
 def yOCTStageInit_1axis(axes: str, max_velocity_mm_sec: float = 2.0, max_acceleration_mm_s_2: float = 3.0) -> float:
     """Initialize stage for one axis and return current position in mm.
+
+    An axis that is already initialized keeps its open device; only the
+    velocity and acceleration are set again.
     
     Args:
         axes (str): Axis identifier ('x', 'y', or 'z')
@@ -49,144 +172,470 @@ def yOCTStageInit_1axis(axes: str, max_velocity_mm_sec: float = 2.0, max_acceler
     if axis not in _stage_serial_numbers:
         raise ValueError(f"Invalid axis: {axes}")
     serial_no = _stage_serial_numbers[axis]
+    i = _AXIS_IDX[axis]
 
-    # XA SDK startup
-    if not hasattr(XASDK, '_oct_xa_started') or not XASDK._oct_xa_started:
-        dll_path = os.path.abspath(os.path.dirname(__file__))
-        if hasattr(os, 'add_dll_directory'):
-            os.add_dll_directory(dll_path)
-        original_cwd = os.getcwd()
+    with _stage_lock:
+        device, worker = _stage_handles[i], _stage_workers[i]
+    if device is not None:
+        # Queued behind any pending moves, like every other command of this axis
         try:
-            os.chdir(dll_path)
-            XASDK.try_load_library(dll_path)
-            XASDK.startup("")
-            XASDK._oct_xa_started = True
-        finally:
-            os.chdir(original_cwd)
+            worker.submit(_set_velocity_params, device,
+                          max_velocity_mm_sec, max_acceleration_mm_s_2).result()
+        except XADeviceException as e:
+            raise RuntimeError(f"XADeviceException during stage init: {e.error_code}")
+        return yOCTStageGetPosition_1axis(axis)
+
+    _start_xa_sdk()
 
     device = None
     try:
-        device = KST201(serial_no, "", TLMC_OperatingModes.Default)
-        device.set_enable_state(TLMC_ChannelEnableStates.ChannelEnabled)
-        device.set_connected_product(actuator_model)
-
-        # Set velocity and acceleration
-        vel_param = device.convert_from_physical_to_device(
-            TLMC_ScaleType.TLMC_ScaleType_Velocity,
-            TLMC_Unit.TLMC_Unit_Millimetres,
-            max_velocity_mm_sec
-        )
-        accel_param = device.convert_from_physical_to_device(
-            TLMC_ScaleType.TLMC_ScaleType_Acceleration,
-            TLMC_Unit.TLMC_Unit_Millimetres,
-            max_acceleration_mm_s_2
-        )
-        device.set_velocity_params(0, accel_param, vel_param)
+        with _stage_open_lock:
+            device = KST201(serial_no, "", TLMC_OperatingModes.Default)
+            device.set_enable_state(TLMC_ChannelEnableStates.ChannelEnabled)
+            device.set_connected_product(actuator_model)
+            _set_velocity_params(device, max_velocity_mm_sec, max_acceleration_mm_s_2)
 
-        pos_counts = device.get_position_counter(TLMC_Wait.TLMC_InfiniteWait)
+        pos_counts = device.get_position_counter(_WAIT_INF)
         pos_conv = device.convert_from_device_units_to_physical(
-            TLMC_ScaleType.TLMC_ScaleType_Distance,
+            _SCALE_DIST,
             pos_counts
         )
         pos_mm = pos_conv.converted_value
 
-        _stage_handles[axis] = device
-        return pos_mm
+        # Cache the counts -> mm scale so later position reads are one
+        # multiply instead of an SDK call. Keep it only if it reproduces the
+        # SDK's own conversion of the current position.
+        scale = _measure_distance_scale(device)
+        mm_per_count, offset_mm = scale
+        if abs(pos_counts * mm_per_count + offset_mm - pos_mm) > 1e-6:
+            scale = None
+        move_scale = scale if _check_move_scale(device, scale, pos_counts) else None
 
-    except XADeviceException as e:
-        if device is not None:
-            try:
-                device.disconnect()
-            except Exception:
-                pass
-            try:
-                device.close()
-            except Exception:
-                pass
-        if axis in _stage_handles:
-            del _stage_handles[axis]
-        raise RuntimeError(f"XADeviceException during stage init: {e.error_code}")
+        worker = _StageWorker(axis)
+        with _stage_lock:
+            _stage_handles[i] = device
+            _stage_distance_scale[i] = scale
+            _stage_move_scale[i] = move_scale
+            _stage_position_mm[i] = pos_mm
+            _stage_workers[i] = worker
+        return pos_mm
 
     except Exception as e:
+        # Release the partially initialized device before reporting
         if device is not None:
-            try:
-                device.disconnect()
-            except Exception:
-                pass
-            try:
-                device.close()
-            except Exception:
-                pass
-        if axis in _stage_handles:
-            del _stage_handles[axis]
+            _disconnect_and_close(device)
+        if isinstance(e, XADeviceException):
+            raise RuntimeError(f"XADeviceException during stage init: {e.error_code}")
         raise RuntimeError(f"Error initializing stage for axis '{axis}': {e}")
 
 
+def yOCTStageInitAll(max_velocity_mm_sec: float = 2.0, max_acceleration_mm_s_2: float = 3.0) -> dict:
+    """Initialize the x, y and z stages and return their positions.
+
+    Devices are opened one at a time (see _stage_open_lock); each axis' position
+    read and scale calibration then run in parallel with the other axes'.
+    Axes that opened stay open even if another axis failed.
+
+    Args:
+        max_velocity_mm_sec (float): Maximum velocity in mm/s (default: 2.0)
+        max_acceleration_mm_s_2 (float): Maximum acceleration in mm/s² (default: 3.0)
+
+    Returns:
+        dict: Current position in mm per axis, e.g. {'x': 1.0, 'y': 2.0, 'z': 0.5}
+
+    Raises:
+        RuntimeError: If initialization of any axis fails
+    """
+    _start_xa_sdk()  # Once, before the axes race for it
+    with ThreadPoolExecutor(max_workers=len(_AXES)) as executor:
+        futures = {axis: executor.submit(yOCTStageInit_1axis, axis,
+                                         max_velocity_mm_sec, max_acceleration_mm_s_2)
+                   for axis in _AXES}
+    return {axis: future.result() for axis, future in futures.items()}
+
+
+def _set_velocity_params(device, max_velocity_mm_sec: float, max_acceleration_mm_s_2: float) -> None:
+    """Set the device's maximum velocity and acceleration."""
+    vel_param = device.convert_from_physical_to_device(
+        TLMC_ScaleType.TLMC_ScaleType_Velocity,
+        TLMC_Unit.TLMC_Unit_Millimetres,
+        max_velocity_mm_sec
+    )
+    accel_param = device.convert_from_physical_to_device(
+        TLMC_ScaleType.TLMC_ScaleType_Acceleration,
+        TLMC_Unit.TLMC_Unit_Millimetres,
+        max_acceleration_mm_s_2
+    )
+    device.set_velocity_params(0, accel_param, vel_param)
+
+
+def _start_xa_sdk() -> None:
+    """Load and start the XA SDK once. Safe to call from several threads."""
+    global _xa_started
+    if _xa_started:
+        return  # Fast path: a plain bool read, no lock
+    with _stage_lock:
+        if _xa_started:
+            return
+        dll_path = os.path.abspath(os.path.dirname(__file__))
+        if hasattr(os, 'add_dll_directory'):
+            os.add_dll_directory(dll_path)
+        _preload_xa_native_dll(dll_path)
+        try:
+            loaded = XASDK.try_load_library(dll_path)
+        except Exception:
+            loaded = False
+        if loaded is False:
+            # Library not found by name: load it from dll_path as the working
+            # directory, the only way some SDK builds honour the path
+            original_cwd = os.getcwd()
+            try:
+                os.chdir(dll_path)
+                XASDK.try_load_library(dll_path)
+            finally:
+                os.chdir(original_cwd)
+        XASDK.startup("")
+        XASDK._oct_xa_started = True
+        _xa_started = True
+
+
+def _preload_xa_native_dll(dll_path: str) -> None:
+    """Load the XA native DLL by absolute path (Windows only).
+
+    XASDK.try_load_library ignores its path argument and loads the DLL by
+    name. Once a DLL of that name is loaded, Windows returns it for any later
+    load by name, so the SDK no longer needs the working directory changed.
+    """
+    global _xa_native_dll
+    native_dll_path = os.path.join(dll_path, _XA_NATIVE_DLL)
+    if os.name != 'nt' or not os.path.exists(native_dll_path):
+        return
+    try:
+        _xa_native_dll = ctypes.WinDLL(native_dll_path)
+    except OSError:
+        pass  # Leave loading to XASDK
+
+
 def yOCTStageSetPosition_1axis(axis: str, position_mm: float) -> None:
-    """Move stage axis to position in mm using XA SDK."""
-    axis = axis.lower()
-    if axis not in _stage_handles:
-        raise RuntimeError(f"Stage for axis {axis} not initialized.")
-    device = _stage_handles[axis]
+    """Move stage axis to position in mm using XA SDK, wait for the move to finish."""
+    yOCTStageSetPosition_1axis_async(axis, position_mm).result()
+
+
+def yOCTStageSetPosition_1axis_async(axis: str, position_mm: float) -> Future:
+    """Queue a move of stage axis to position in mm and return without waiting.
+
+    Moves are executed by the axis' worker thread in the order they were queued.
+
+    Args:
+        axis (str): Axis identifier ('x', 'y', or 'z')
+        position_mm (float): Target position in mm
+
+    Returns:
+        Future: Resolves to None once the move completes, or raises RuntimeError
+            if the move failed
+
+    Raises:
+        RuntimeError: If the axis was not initialized
+    """
+    i, device, worker = _initialized_axis(axis)
+    future = worker.submit(_move_absolute, i, device, float(position_mm))
+    with _stage_lock:
+        if _stage_workers[i] is worker:  # Not closed (or reopened) meanwhile
+            _stage_last_move[i] = future
+    return future
+
+
+def yOCTStageWaitMoveComplete(axis: str, timeout_s: float = None) -> None:
+    """Wait for the last move queued on an axis to finish.
+
+    Moves run in order, so this waits for every move queued before it as well.
+    Lets a caller start a move with yOCTStageSetPosition_1axis_async, do other
+    work (e.g. save the previous scan), then block only for what is left.
+
+    Args:
+        axis (str): Axis identifier ('x', 'y', or 'z')
+        timeout_s (float): Longest time to wait in seconds, None to wait until done
+
+    Returns:
+        None
+
+    Raises:
+        RuntimeError: If the axis was not initialized, or the last move failed
+        TimeoutError: If the move did not finish within timeout_s
+    """
+    i, _, _ = _initialized_axis(axis)
+    with _stage_lock:
+        future = _stage_last_move[i]
+    if future is not None:
+        future.result(timeout=timeout_s)
+
+
+async def yOCTStageSetPositions(positions: dict) -> None:
+    """Move several stage axes concurrently and wait for all of them.
+
+    Each axis moves on its own worker thread, so the total time is that of
+    the slowest axis rather than the sum of all axes.
+
+    Args:
+        positions (dict): Target position in mm per axis, e.g. {'x': 1.0, 'z': 0.5}
+
+    Returns:
+        None
+
+    Raises:
+        RuntimeError: If an axis was not initialized or a position is not a
+            number (then no axis is moved), or if a move failed
+    """
+    futures = _submit_moves(positions)
+    await asyncio.gather(*(asyncio.wrap_future(future) for future in futures))
+
+
+def yOCTStageSetPositions_sync(positions: dict) -> None:
+    """Blocking yOCTStageSetPositions, for callers without an event loop (e.g. MATLAB)."""
+    futures = _submit_moves(positions)
+    wait(futures)
+    for future in futures:
+        future.result()  # Raise the first failure, if any
+
+
+def yOCTStageSetPositionXY(x_mm: float, y_mm: float) -> None:
+    """Move the x and y stages together and wait for both (e.g. between tiles).
+
+    Raises:
+        RuntimeError: If x or y was not initialized or a position is not a
+            number (then neither is moved), or if a move failed
+    """
+    yOCTStageSetPositions_sync({'x': x_mm, 'y': y_mm})
+
+
+def _submit_moves(positions: dict) -> list:
+    """Queue one move per axis after checking all axes and positions.
+
+    Nothing is queued unless every axis is initialized and every position
+    converts to float, so a bad entry never leaves a partial move.
+    """
+    with _stage_lock:
+        missing = [axis for axis in positions
+                   if axis.lower() not in _AXIS_IDX
+                   or _stage_handles[_AXIS_IDX[axis.lower()]] is None]
+    if missing:
+        raise RuntimeError(f"Stage for axis {', '.join(missing)} not initialized.")
+
+    targets, invalid = [], []
+    for axis, position_mm in positions.items():
+        try:
+            targets.append((axis, float(position_mm)))
+        except (TypeError, ValueError):
+            invalid.append(f"{axis}={position_mm!r}")
+    if invalid:
+        raise RuntimeError(f"Invalid stage position: {', '.join(invalid)}")
+
+    return [yOCTStageSetPosition_1axis_async(axis, position_mm)
+            for axis, position_mm in targets]
+
+
+def yOCTStageGetPosition_1axis(axis: str) -> float:
+    """Read the current position of stage axis in mm.
+
+    The read is queued behind any pending moves of this axis, so it returns
+    the position after those moves completed.
+
+    Args:
+        axis (str): Axis identifier ('x', 'y', or 'z')
+
+    Returns:
+        float: Current position in mm
+
+    Raises:
+        RuntimeError: If the axis was not initialized or the read failed
+    """
+    i, device, worker = _initialized_axis(axis)
+    return worker.submit(_read_position_mm, i, device).result()
+
+
+def _initialized_axis(axis: str) -> tuple:
+    """Return (index, device, worker) of an initialized axis, read together.
+
+    Raises:
+        RuntimeError: If the axis is unknown or was not initialized
+    """
+    i = _AXIS_IDX.get(axis.lower())
+    if i is not None:
+        with _stage_lock:
+            device, worker = _stage_handles[i], _stage_workers[i]
+        if device is not None:
+            return i, device, worker
+    raise RuntimeError(f"Stage for axis {axis} not initialized.")
+
+
+def _read_position_mm(i: int, device) -> float:
+    """Blocking position read, runs on the axis' worker thread."""
     try:
-        abs_param = device.convert_from_physical_to_device(
-            TLMC_ScaleType.TLMC_ScaleType_Distance,
-            TLMC_Unit.TLMC_Unit_Millimetres,
-            float(position_mm)
-        )
-        MOVE_TIMEOUT_MS = 120000
+        pos_counts = device.get_position_counter(_WAIT_INF)
+        pos_mm = _counts_to_mm(i, device, pos_counts)
+    except XADeviceException as e:
+        raise RuntimeError(f"XADeviceException during position read: {e.error_code}")
+    _stage_position_mm[i] = pos_mm
+    return pos_mm
+
+
+def _counts_to_mm(i: int, device, counts: int) -> float:
+    """Convert device counts to mm using the axis' cached linear scale."""
+    scale = _stage_distance_scale[i]
+    if scale is None:
+        return device.convert_from_device_units_to_physical(
+            _SCALE_DIST,
+            counts
+        ).converted_value
+    mm_per_count, offset_mm = scale
+    return counts * mm_per_count + offset_mm
+
+
+def _measure_distance_scale(device) -> tuple:
+    """Measure the device's counts -> mm conversion from two points.
+
+    Returns:
+        tuple: (mm_per_count, offset_mm)
+    """
+    zero_mm = device.convert_from_device_units_to_physical(
+        _SCALE_DIST, 0).converted_value
+    ref_mm = device.convert_from_device_units_to_physical(
+        _SCALE_DIST, _CALIBRATION_COUNTS).converted_value
+    return (ref_mm - zero_mm) / _CALIBRATION_COUNTS, zero_mm
+
+
+def _check_move_scale(device, scale: tuple, pos_counts: int) -> bool:
+    """True if _mm_to_counts(scale, ...) matches the SDK's mm -> counts conversion.
+
+    Checked at points 0.3 and 0.7 counts past the current position, which tells
+    rounding from truncation, and the SDK must return plain int counts.
+    """
+    if scale is None:
+        return False
+    mm_per_count, offset_mm = scale
+    for counts in (pos_counts + 0.3, pos_counts + 0.7):
+        position_mm = counts * mm_per_count + offset_mm
+        sdk_counts = device.convert_from_physical_to_device(
+            _SCALE_DIST, _UNIT_MM, position_mm)
+        if type(sdk_counts) is not int or sdk_counts != _mm_to_counts(scale, position_mm):
+            return False
+    return True
+
+
+def _mm_to_counts(scale: tuple, position_mm: float) -> int:
+    """Convert mm to device counts with a cached linear scale."""
+    mm_per_count, offset_mm = scale
+    return round((position_mm - offset_mm) / mm_per_count)
+
+
+def _move_absolute(i: int, device, position_mm: float) -> None:
+    """Blocking absolute move, runs on the axis' worker thread."""
+    current_mm = _stage_position_mm[i]
+    if current_mm is not None and abs(position_mm - current_mm) < _FINISH_ERROR_MM:
+        return  # Already there
+
+    # Position is unknown until the move succeeds
+    _stage_position_mm[i] = None
+    try:
+        move_scale = _stage_move_scale[i]
+        if move_scale is not None:
+            abs_param = _mm_to_counts(move_scale, position_mm)
+        else:
+            abs_param = device.convert_from_physical_to_device(
+                _SCALE_DIST,
+                _UNIT_MM,
+                position_mm
+            )
         device.move_absolute(
-            TLMC_MoveModes.MoveMode_Absolute,
+            _MODE_ABS,
             abs_param,
-            MOVE_TIMEOUT_MS
+            _MOVE_TIMEOUT_MS
         )
 
     except XADeviceException as e:
         err_msg = getattr(e, 'message', None) or str(e)
         raise RuntimeError(f"XADeviceException during move: code={getattr(e,'error_code',None)} msg={err_msg}")
     except Exception as e:
-        raise RuntimeError(f"Error during move for axis {axis}: {e}")
+        raise RuntimeError(f"Error during move for axis {_AXES[i]}: {e}")
+    _stage_position_mm[i] = position_mm
 
 
 def yOCTStageClose_1axis(axis: str) -> None:
     """Close stage for one axis (disconnect -> close)."""
     axis = axis.lower()
-    if axis in _stage_handles:
-        device = _stage_handles[axis]
-        error_occurred = None
-        try:
-            device.disconnect()
-        except Exception as e:
+    i = _AXIS_IDX.get(axis)
+    if i is None:
+        return
+    # Detach the axis first, so no new commands can be queued for it
+    with _stage_lock:
+        device, worker = _stage_handles[i], _stage_workers[i]
+        _stage_handles[i] = None
+        _stage_workers[i] = None
+        _stage_distance_scale[i] = None
+        _stage_move_scale[i] = None
+        _stage_position_mm[i] = None
+        _stage_last_move[i] = None
+    if device is None:
+        return
+
+    # Let queued moves finish before releasing the device
+    if worker is not None:
+        worker.stop()
+    error_occurred = _disconnect_and_close(device)
+    if error_occurred is not None:
+        raise RuntimeError(f"Error closing stage for axis {axis}: {error_occurred}")
+
+
+def _disconnect_and_close(device):
+    """Disconnect then close a device, attempting both even if one fails.
+
+    Returns:
+        Exception: The first error raised, or None
+    """
+    error_occurred = None
+    try:
+        device.disconnect()
+    except Exception as e:
+        error_occurred = e
+    try:
+        device.close()
+    except Exception as e:
+        if error_occurred is None:
             error_occurred = e
-        try:
-            device.close()
-        except Exception as e:
-            if error_occurred is None:
-                error_occurred = e
-        del _stage_handles[axis]
-        if error_occurred is not None:
-            raise RuntimeError(f"Error closing stage for axis {axis}: {error_occurred}")
+    return error_occurred
 
 
 def yOCTCloseAllStages():
-    """Close all stage handles and leave XA SDK running (do not shutdown)."""
-    global _stage_handles
-    while _stage_handles:
-        axis, dev = _stage_handles.popitem()
-        try:
-            dev.disconnect()
-        except Exception:
-            pass
-        try:
-            dev.close()
-        except Exception:
-            pass
-    gc.collect()
+    """Close all stage handles and leave XA SDK running (do not shutdown).
+
+    Axes are closed in parallel, so teardown takes as long as the slowest axis
+    rather than the sum of all axes.
+    """
+    axes = [axis for i, axis in enumerate(_AXES) if _stage_handles[i] is not None]
+    if not axes:
+        return  # Nothing open
+    with ThreadPoolExecutor(max_workers=len(axes)) as executor:
+        list(executor.map(_close_axis_best_effort, axes))
+
+
+def _close_axis_best_effort(axis: str) -> None:
+    """Close one axis, ignoring errors (used during teardown)."""
+    try:
+        yOCTStageClose_1axis(axis)
+    except Exception:
+        pass
 
 
 __all__ = [
     'yOCTStageInit_1axis',
+    'yOCTStageInitAll',
     'yOCTStageSetPosition_1axis',
+    'yOCTStageSetPosition_1axis_async',
+    'yOCTStageSetPositions',
+    'yOCTStageSetPositions_sync',
+    'yOCTStageSetPositionXY',
+    'yOCTStageWaitMoveComplete',
+    'yOCTStageGetPosition_1axis',
     'yOCTStageClose_1axis',
     'yOCTCloseAllStages'
 ]
@@ -254,9 +254,9 @@ case 'init'
                     if v
                         fprintf('%s [Gan632] Initializing Python-based stage control (3 axes)...\n', datestr(datetime));
                     end
-                    z0 = gOCTHardwareStatus.module.stage.yOCTStageInit_1axis('z');
-                    x0 = gOCTHardwareStatus.module.stage.yOCTStageInit_1axis('x');
-                    y0 = gOCTHardwareStatus.module.stage.yOCTStageInit_1axis('y');
+                    % All 3 axes are opened in parallel
+                    p0 = struct(gOCTHardwareStatus.module.stage.yOCTStageInitAll());
+                    x0 = p0.x; y0 = p0.y; z0 = p0.z;
 
                 otherwise
                     error('Unknown OCT system: %s', gOCTHardwareStatus.name);
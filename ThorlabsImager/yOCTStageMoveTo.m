@@ -80,21 +80,33 @@ end
 %% Move stage - system-specific commands
 if ~skipHardware
     s = 'xyz';
-    for i=1:3
-        if abs(d_(i)) > 0
-            switch(octSystemName)
-                case 'ganymede'
-                    % Ganymede: C# DLL stage control
-                    ThorlabsImagerNET.ThorlabsImager.yOCTStageSetPosition(s(i), gStageCurrentStagePosition_StageCoordinates(i));
-                    
-                case 'gan632'
-                    % Gan632: Python stage control
-                    octSystemModule.stage.yOCTStageSetPosition_1axis(s(i), gStageCurrentStagePosition_StageCoordinates(i));
-                    
-                otherwise
-                    error('Unknown OCT system: %s', octSystemName);
+    p = gStageCurrentStagePosition_StageCoordinates;
+    switch(octSystemName)
+        case 'ganymede'
+            % Ganymede: C# DLL stage control
+            for i=1:3
+                if abs(d_(i)) > 0
+                    ThorlabsImagerNET.ThorlabsImager.yOCTStageSetPosition(s(i), p(i));
+                end
             end
-        end
+            
+        case 'gan632'
+            % Gan632: Python stage control. When both x and y move, they
+            % move together in one call. z still moves after x and y.
+            if abs(d_(1)) > 0 && abs(d_(2)) > 0
+                octSystemModule.stage.yOCTStageSetPositionXY(p(1), p(2));
+                iStart = 3;
+            else
+                iStart = 1;
+            end
+            for i=iStart:3
+                if abs(d_(i)) > 0
+                    octSystemModule.stage.yOCTStageSetPosition_1axis(s(i), p(i));
+                end
+            end
+            
+        otherwise
+            error('Unknown OCT system: %s', octSystemName);
     end
 else
     if (v)